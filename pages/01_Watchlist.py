@@ -60,11 +60,12 @@ if watchlist:
             c2.write(f"{row['Last price']:.2f}")
             c3.write(f"{row['30d %']:.2f}%")
             if c4.button("Open in Home", key=f"open_{row['Ticker']}"):
-                st.experimental_set_query_params(ticker=row["Ticker"])
+                # switch_page drops query params; session_state survives the page change
+                st.session_state["qb_ticker"] = row["Ticker"]
                 try:
                     st.switch_page("streamlit_app.py")
                 except Exception:
-                    st.info("Open Home from the menu; the ticker was set.")
+                    st.info(f"Open Home from the menu; {row['Ticker']} will be preselected.")
 else:
     st.info("Add tickers from the sidebar.")
 
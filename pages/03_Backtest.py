@@ -15,7 +15,13 @@ def load_prices(ticker: str, start: dt.date, end: dt.date) -> pd.DataFrame:
     if df.empty:
         return df
     df = df[["Close"]].rename(columns={"Close": "close"}).dropna()
-    df["ret"] = df["close"].pct_change().fillna(0.0)
+    # retornos simples en numpy: evita la maquinaria de pct_change
+    c = df["close"].to_numpy(dtype=np.float64)
+    ret = np.empty_like(c)
+    np.divide(c[1:], c[:-1], out=ret[1:])
+    ret[1:] -= 1.0
+    ret[0] = 0.0
+    df["ret"] = ret
     return df
 
 def add_smas(df: pd.DataFrame, fast: int, slow: int) -> pd.DataFrame:
@@ -29,11 +35,15 @@ def signals(df: pd.DataFrame) -> pd.Series:
 
 def backtest(df: pd.DataFrame, sig: pd.Series, fee_bp: float = 5.0) -> pd.DataFrame:
     out = df.copy()
+    # posición previa y cambios de posición en una pasada de numpy
+    pos = sig.to_numpy(dtype=np.float64)
+    prev = np.empty_like(pos)
+    prev[:1] = 0.0
+    prev[1:] = pos[:-1]
+    changed = pos != prev
     out["signal"] = sig
-    out["signal_prev"] = out["signal"].shift(1).fillna(0)
-    out["str_ret"] = out["ret"] * out["signal_prev"]
-    fee = (out["signal"] != out["signal_prev"]).astype(int) * (fee_bp / 10000.0)
-    out["str_ret"] -= fee
+    out["signal_prev"] = prev
+    out["str_ret"] = out["ret"].to_numpy() * prev - changed * (fee_bp / 10000.0)
     out["equity"] = (1 + out["str_ret"]).cumprod()
     out["buy_hold"] = (1 + out["ret"]).cumprod()
     return out
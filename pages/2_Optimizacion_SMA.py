@@ -1,7 +0,0 @@
-import streamlit as st
-
-st.set_page_config(page_title="Optimize SMA", page_icon="⚙️", layout="wide")
-st.title("⚙️ Optimize SMA")
-
-st.info("Esta página fue reemplazada por **SMA Heatmap**. Usá el ítem *SMA Heatmap* del menú para optimizar parámetros.")
-
@@ -0,0 +1,77 @@
+"""Disk-backed cache for DataFrame-returning functions (price downloads)."""
+from __future__ import annotations
+
+import functools
+import hashlib
+import inspect
+import time
+from pathlib import Path
+from typing import Callable
+
+import pandas as pd
+
+# Repo root, same anchor as the watchlist so the cache works from any cwd
+BASE_DIR = Path(__file__).resolve().parent.parent
+CACHE_DIR = BASE_DIR / ".cache"
+
+
+def _evict(cache_dir: Path, max_age: float) -> None:
+    """Delete parquet entries in ``cache_dir`` older than ``max_age`` seconds."""
+    now = time.time()
+    for entry in cache_dir.glob("*.parquet"):
+        try:
+            if now - entry.stat().st_mtime >= max_age:
+                entry.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+
+def disk_cache(
+    ttl_days: float = 1,
+    cache_dir: str | Path = CACHE_DIR,
+    when: Callable[..., bool] | None = None,
+):
+    """Persist non-empty frames as parquet keyed on the md5 of the call arguments.
+
+    Entries expire after ``ttl_days`` and are deleted; ``when`` can veto caching per call.
+    """
+
+    def decorator(func):
+        sig = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if when is not None and not when(*args, **kwargs):
+                return func(*args, **kwargs)
+
+            bound = sig.bind(*args, **kwargs)
+            bound.apply_defaults()
+            raw = "|".join(str(v) for v in bound.arguments.values())
+            key = hashlib.md5(f"{func.__qualname__}|{raw}".encode("utf-8")).hexdigest()
+            path = Path(cache_dir) / f"{key}.parquet"
+            max_age = ttl_days * 86400
+
+            try:
+                if path.exists():
+                    if time.time() - path.stat().st_mtime < max_age:
+                        return pd.read_parquet(path)
+                    path.unlink(missing_ok=True)
+            except Exception:
+                pass
+
+            df = func(*args, **kwargs)
+            if isinstance(df, pd.DataFrame) and not df.empty:
+                try:
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    df.to_parquet(path)
+                    _evict(path.parent, max_age)
+                except Exception:
+                    pass
+            return df
+
+        return wrapper
+
+    return decorator
+
+
+__all__ = ["disk_cache"]
@@ -0,0 +1,56 @@
+# cython: language_level=3
+"""Cython build of the Wilder RSI recursion in ``_kernels.rsi_wilder``.
+
+Built with ``cythonize -i quantboard/_indicators_c.pyx``. ``indicators`` uses
+it for RSI when numba is not installed, instead of the interpreted loop.
+"""
+cimport cython
+from cython cimport floating
+from libc.math cimport NAN, isnan
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def rsi_core(const floating[::1] c, Py_ssize_t n, floating[::1] out):
+    """Wilder RSI of ``c`` written into ``out``; the first ``n`` values are NaN."""
+    cdef Py_ssize_t m = c.shape[0]
+    cdef Py_ssize_t i
+    cdef double d, v
+    cdef double gain = 0.0
+    cdef double loss = 0.0
+    cdef double prev
+    cdef bint seen = False
+
+    for i in range(m):
+        out[i] = NAN
+    if m <= n:
+        return out.base
+    # same missing-bar rule as the numba kernel: a NaN close is no move, the
+    # averages are kept and the next delta is taken from the last valid close
+    prev = c[0]
+    for i in range(1, n + 1):
+        v = c[i]
+        if not isnan(v):
+            if not isnan(prev):
+                d = v - prev
+                gain += d if d > 0.0 else 0.0
+                loss += -d if d < 0.0 else 0.0
+                seen = True
+            prev = v
+    gain /= n
+    loss /= n
+    if seen:
+        out[n] = 100.0 - 100.0 / (1.0 + gain / loss) if loss > 0 else 100.0
+    for i in range(n + 1, m):
+        v = c[i]
+        if not isnan(v):
+            if not isnan(prev):
+                d = v - prev
+                gain = (gain * (n - 1) + (d if d > 0.0 else 0.0)) / n
+                loss = (loss * (n - 1) + (-d if d < 0.0 else 0.0)) / n
+                seen = True
+            prev = v
+        if seen:
+            out[i] = 100.0 - 100.0 / (1.0 + gain / loss) if loss > 0 else 100.0
+    return out.base
@@ -0,0 +1,23 @@
+"""Optional Numba support for QuantBoard numeric kernels."""
+from __future__ import annotations
+
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    # fallback: kernels run as plain Python when numba is not installed
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def _wrap(func):
+            return func
+
+        return _wrap
+
+
+__all__ = ["njit", "prange", "NUMBA_AVAILABLE"]
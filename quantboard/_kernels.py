@@ -0,0 +1,155 @@
+"""Numeric kernels shared by indicators, strategies and the backtester, with an AOT build entry.
+
+``python -m quantboard._kernels`` compiles these functions with ``numba.pycc``
+into ``quantboard/qb_kernels`` (a native extension), so a fresh process can
+call them without paying the JIT compile. Callers import the compiled module
+when present and fall back to ``njit`` otherwise.
+
+The object code targets a generic x86-64 CPU so the extension runs anywhere.
+Set ``QB_TARGET_CPU`` (``host``, ``skylake``, ...) when the build machine is the
+one that will run it, to let LLVM use AVX2/FMA.
+"""
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import numpy as np
+
+
+def sma_rolling(x: np.ndarray, w: int) -> np.ndarray:
+    """Rolling mean via a running sum: add the new value, drop the one leaving.
+
+    Windows containing a NaN are NaN, matching ``rolling(w).mean()``. The sum
+    is kept in float64 whatever the input dtype; the output matches the input.
+    """
+    n = x.shape[0]
+    out = np.empty_like(x)
+    out[:] = np.nan
+    s = 0.0
+    nans = 0
+    for i in range(n):
+        v = x[i]
+        if np.isnan(v):
+            nans += 1
+        else:
+            s += v
+        if i >= w:
+            old = x[i - w]
+            if np.isnan(old):
+                nans -= 1
+            else:
+                s -= old
+        if i >= w - 1 and nans == 0:
+            out[i] = s / w
+    return out
+
+
+def rsi_wilder(c: np.ndarray, n: int, out: np.ndarray) -> np.ndarray:
+    """Wilder RSI in a single pass, written into ``out``; the first ``n`` values are NaN.
+
+    Averages are float64 accumulators; ``out`` has the input's length and dtype
+    and is returned, so callers can reuse one buffer across calls.
+    """
+    m = c.shape[0]
+    out[:] = np.nan
+    if m <= n:
+        return out
+    # a NaN close is a missing bar: no move, the averages are kept and the
+    # next delta is taken from the last valid close
+    gain = 0.0
+    loss = 0.0
+    prev = c[0]
+    seen = False
+    for i in range(1, n + 1):
+        v = c[i]
+        if not np.isnan(v):
+            if not np.isnan(prev):
+                d = v - prev
+                gain += max(d, 0.0)
+                loss += max(-d, 0.0)
+                seen = True
+            prev = v
+    gain /= n
+    loss /= n
+    if seen:
+        out[n] = 100.0 - 100.0 / (1.0 + gain / loss) if loss > 0 else 100.0
+    for i in range(n + 1, m):
+        v = c[i]
+        if not np.isnan(v):
+            if not np.isnan(prev):
+                d = v - prev
+                gain = (gain * (n - 1) + max(d, 0.0)) / n
+                loss = (loss * (n - 1) + max(-d, 0.0)) / n
+                seen = True
+            prev = v
+        if seen:
+            out[i] = 100.0 - 100.0 / (1.0 + gain / loss) if loss > 0 else 100.0
+    return out
+
+
+def rsi_signal(r: np.ndarray, lo: float, hi: float) -> np.ndarray:
+    """Long/flat position: enter when RSI crosses up ``lo``, exit when it crosses down ``hi``."""
+    m = r.shape[0]
+    out = np.zeros(m, dtype=np.int8)
+    pos = 0
+    for i in range(1, m):
+        if r[i - 1] < lo and r[i] >= lo:
+            pos = 1
+        elif r[i - 1] > hi and r[i] <= hi:
+            pos = 0
+        out[i] = pos
+    return out
+
+
+def backtest_core(close: np.ndarray, sig: np.ndarray, cost_rate: float) -> np.ndarray:
+    """Strategy returns (row 0) and equity (row 1) of a position series in one pass.
+
+    Forward-fills NaN closes and NaN/inf signals, clips positions to [-1, 1],
+    charges ``cost_rate`` per unit of turnover and trades on the next bar.
+    """
+    n = close.shape[0]
+    out = np.empty((2, n))
+    prev_c = np.nan
+    prev_p = 0.0
+    p = 0.0
+    eq = 1.0
+    for i in range(n):
+        c = close[i]
+        if np.isnan(c):
+            c = prev_c
+        r = 0.0
+        if i > 0 and not np.isnan(c) and not np.isnan(prev_c) and prev_c != 0.0:
+            r = c / prev_c - 1.0
+        s = sig[i]
+        if not np.isnan(s) and not np.isinf(s):
+            p = min(max(s, -1.0), 1.0)
+        turn = abs(p - prev_p) if i > 0 else 0.0
+        ret = prev_p * r - turn * cost_rate
+        eq *= 1.0 + ret
+        out[0, i] = ret
+        out[1, i] = eq
+        prev_c = c
+        prev_p = p
+    return out
+
+
+def _build() -> None:
+    from numba.pycc import CC
+
+    cc = CC("qb_kernels")
+    cc.output_dir = str(Path(__file__).resolve().parent)
+    target_cpu = os.environ.get("QB_TARGET_CPU")
+    if target_cpu:
+        cc.target_cpu = target_cpu
+    cc.export("sma_rolling", "f8[:](f8[:], i8)")(sma_rolling)
+    cc.export("sma_rolling_f4", "f4[:](f4[:], i8)")(sma_rolling)
+    cc.export("rsi_wilder", "f8[:](f8[:], i8, f8[:])")(rsi_wilder)
+    cc.export("rsi_wilder_f4", "f4[:](f4[:], i8, f4[:])")(rsi_wilder)
+    cc.export("rsi_signal", "i1[:](f8[:], f8, f8)")(rsi_signal)
+    cc.export("backtest_core", "f8[:,:](f8[:], f8[:], f8)")(backtest_core)
+    cc.compile()
+
+
+if __name__ == "__main__":
+    _build()
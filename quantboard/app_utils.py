@@ -0,0 +1,87 @@
+"""Shared helpers for the Streamlit entrypoint: cached price fetch, auto-refresh, formatting."""
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+
+import pandas as pd
+import streamlit as st
+
+from ._diskcache import disk_cache
+from .data import get_prices
+
+try:
+    from streamlit_autorefresh import st_autorefresh
+except ImportError:
+    # fallback: a run_every fragment lets the browser schedule the rerun
+    def st_autorefresh(interval: int = 1000, *, limit: int | None = None, key: str | None = None) -> int:
+        armed = key or "st_autorefresh"
+        # every full run disarms; only a timer-driven fragment run finds it armed
+        st.session_state[armed] = False
+
+        @st.fragment(run_every=interval / 1000.0)
+        def _tick() -> None:
+            if st.session_state.get(armed):
+                st.rerun()
+            st.session_state[armed] = True
+
+        _tick()
+        return 0
+
+# --- Auto-refresh (every 60s) for 1m interval ---
+def autorefresh_if_needed(enabled: bool, interval: str) -> None:
+    if enabled and interval == "1m":
+        st_autorefresh(interval=60_000, limit=None, key="qb_autorefresh")
+
+def _normalize_prices(df: pd.DataFrame | None) -> pd.DataFrame:
+    if df is None or df.empty:
+        return pd.DataFrame()
+    # normaliza a minúscula
+    df = df.rename(columns=str.lower)
+    if not isinstance(df.index, pd.DatetimeIndex):
+        df.index = pd.to_datetime(df.index)
+    # coerce once per fetch so reruns get float64 columns directly
+    for col in ("open", "high", "low", "close"):
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors="coerce")
+    return df.dropna()
+
+@st.cache_data(ttl=60, show_spinner=False)
+@disk_cache(ttl_days=1, when=lambda ticker, start, end, interval: interval != "1m")
+def _download_prices(ticker: str, start: date | datetime, end: date | datetime, interval: str) -> pd.DataFrame:
+    return _normalize_prices(get_prices(ticker, start=start, end=end, interval=interval))
+
+def fetch_prices_cached(ticker: str, start: date | datetime, end: date | datetime, interval: str) -> pd.DataFrame:
+    ticker = (ticker or "").strip().upper()
+    if interval != "1m":
+        return _download_prices(ticker, start, end, interval)
+    # 1m refreshes only download the bars after the last one this session already has;
+    # the merge stays outside st.cache_data because session_state is per session
+    state_key = f"_cache_{ticker}_{interval}_{start}_{end}"
+    cached = st.session_state.get(state_key)
+    if cached is not None and not cached.empty:
+        since = cached.index[-1] - timedelta(minutes=2)
+        new = _download_prices(ticker, since, end, interval)
+        if new.empty:
+            df = cached
+        else:
+            combined = pd.concat([cached, new])
+            df = combined.loc[~combined.index.duplicated(keep="last")]
+    else:
+        df = _download_prices(ticker, start, end, interval)
+    if not df.empty:
+        st.session_state[state_key] = df
+    return df
+
+TS_FMT = "%Y-%m-%d %H:%M:%S"
+
+def format_ts(ts: pd.Timestamp) -> str:
+    # strftime already renders tz-aware bars in exchange time; no tz_localize needed
+    return "-" if pd.isna(ts) else ts.strftime(TS_FMT)
+
+__all__ = [
+    "st_autorefresh",
+    "autorefresh_if_needed",
+    "fetch_prices_cached",
+    "TS_FMT",
+    "format_ts",
+]
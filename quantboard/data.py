@@ -1,5 +1,11 @@
+import numpy as np
 import pandas as pd
 import yfinance as yf
+try:
+    # optional: persistent on-disk cache shared across sessions and restarts
+    import yfinance_cache as yfc
+except ImportError:
+    yfc = None
 try:
     import streamlit as st
     cache = st.cache_data(show_spinner=False, ttl=60)
@@ -9,26 +15,42 @@ except Exception:
         return func
     cache = _no_cache
 
-@cache
-def get_prices(ticker: str, start: str, end: str, interval: str = "1d") -> pd.DataFrame:
+_OHLCV = ("Open", "High", "Low", "Close", "Volume")
+
+def _history_yfc(ticker: str, start: str, end: str, interval: str) -> pd.DataFrame | None:
+    if yfc is None:
+        return None
     try:
-        df = yf.download(
-            ticker,
+        df = yfc.Ticker(ticker).history(
             start=start,
             end=end,
             interval=interval,
-            auto_adjust=True,
-            progress=False,
+            adjust_splits=True,
+            adjust_divs=True,
+            quiet=True,
         )
-        if isinstance(df.columns, pd.MultiIndex):
-            # If multiple tickers accidentally passed, keep first level if present
-            try:
-                df = df.xs(ticker, axis=1, level=1)
-            except Exception:
-                df = df.droplevel(0, axis=1)
-        df = df.rename(columns=str.lower)
-        df.index = pd.to_datetime(df.index)
-        df = df.dropna()
-        return df
+    except Exception:
+        return None
+    # yfc adds its own bookkeeping columns; keep the OHLCV ones yf.download returns
+    return df[[c for c in _OHLCV if c in df.columns]]
+
+@cache
+def get_prices(ticker: str, start: str, end: str, interval: str = "1d") -> pd.DataFrame:
+    try:
+        df = _history_yfc(ticker, start, end, interval)
+        if df is None:
+            # Ticker.history always returns flat columns, unlike yf.download
+            df = yf.Ticker(ticker).history(
+                start=start,
+                end=end,
+                interval=interval,
+                auto_adjust=True,
+            )
+        # one frame straight from the OHLCV arrays instead of rename/to_datetime/dropna copies
+        arrs = {c.lower(): df[c].to_numpy() for c in _OHLCV if c in df.columns}
+        if not arrs:
+            return pd.DataFrame()
+        keep = np.logical_and.reduce([np.isfinite(a) for a in arrs.values()])
+        return pd.DataFrame({k: a[keep] for k, a in arrs.items()}, index=pd.DatetimeIndex(df.index)[keep])
     except Exception:
         return pd.DataFrame()
@@ -1,21 +1,135 @@
-﻿import pandas as pd
+﻿import os
+
+import pandas as pd
 import numpy as np
 
+from . import _kernels
+from ._jit import NUMBA_AVAILABLE, njit, prange
+
+# fast-math without nnan/ninf: NaN closes must still propagate through the recursion
+_FASTMATH = {"nsz", "arcp", "contract", "afn", "reassoc"}
+
+# float32 halves the bytes per bar; both are compiled up front
+_SIGNATURES = ["f8[:](f8[:], i8)", "f4[:](f4[:], i8)"]
+_RSI_SIGNATURES = ["f8[:](f8[:], i8, f8[:])", "f4[:](f4[:], i8, f4[:])"]
+
+try:
+    # Cython build (``cythonize -i quantboard/_indicators_c.pyx``): compiled RSI without numba
+    from ._indicators_c import rsi_core as _rsi_cython
+except ImportError:
+    _rsi_cython = None
+
+try:
+    # AOT build from ``python -m quantboard._kernels``: no JIT on cold start
+    from .qb_kernels import (
+        rsi_wilder as _rsi_f8,
+        rsi_wilder_f4 as _rsi_f4,
+        sma_rolling as _sma_f8,
+        sma_rolling_f4 as _sma_f4,
+    )
+
+    # AOT exports are typed per signature; pick the one matching the input
+    def _rsi_aot(c: np.ndarray, n: int, out: np.ndarray) -> np.ndarray:
+        return (_rsi_f4 if c.dtype == np.float32 else _rsi_f8)(c, n, out)
+
+    def _sma_core(x: np.ndarray, w: int) -> np.ndarray:
+        return (_sma_f4 if x.dtype == np.float32 else _sma_f8)(x, w)
+
+    _rsi_core = _rsi_aot
+    _SMA_COMPILED = True
+except ImportError:
+    # eager signatures: compiled (or loaded from cache) at import, not on the first call
+    _rsi_core = njit(_RSI_SIGNATURES, cache=True, fastmath=_FASTMATH)(_kernels.rsi_wilder)
+    if not NUMBA_AVAILABLE and _rsi_cython is not None:
+        # numba's kernel is ~2x faster per call, so Cython only replaces the interpreted loop
+        _rsi_core = _rsi_cython
+    _sma_core = njit(_SIGNATURES, nogil=True, cache=True, fastmath=_FASTMATH, boundscheck=False)(
+        _kernels.sma_rolling
+    )
+    # interpreted, the running-sum loop loses to the numpy cumsum path at any length
+    _SMA_COMPILED = NUMBA_AVAILABLE
+
+def _sma_cumsum(a: np.ndarray, window: int) -> np.ndarray:
+    # prefix sums of values and of NaN counts: a window containing a NaN stays NaN, like rolling()
+    n = a.shape[0]
+    out = np.full(n, np.nan, dtype=a.dtype)
+    if window > n:
+        return out
+    isnan = np.isnan(a)
+    cs = np.cumsum(np.where(isnan, 0.0, a), dtype=np.float64)
+    cn = np.cumsum(isnan)
+    sums = cs[window - 1:].copy()
+    sums[1:] -= cs[:-window]
+    nans = cn[window - 1:].copy()
+    nans[1:] -= cn[:-window]
+    out[window - 1:] = np.where(nans == 0, sums / window, np.nan)
+    return out
+
+def _warmup() -> None:
+    # first real call then only pays the dispatch, not loading the cached machine code
+    for dtype in (np.float64, np.float32):
+        dummy = np.linspace(1.0, 2.0, 16, dtype=dtype)
+        _sma_core(dummy, 3)
+        _rsi_core(dummy, 3, np.empty_like(dummy))
+
+if os.environ.get("QB_NO_WARMUP") != "1":
+    _warmup()
+
 # --- Simple Moving Average ---
-def sma(series: pd.Series, window: int = 20) -> pd.Series:
-    return series.rolling(window).mean().rename(f"SMA_{window}")
+def sma(series: pd.Series, window: int = 20, dtype: np.dtype = np.float64) -> pd.Series:
+    if window < 0:
+        raise ValueError("window must be an integer 0 or greater")
+    a = series.to_numpy(dtype=dtype, na_value=np.nan)
+    if window == 0:
+        out = np.full(len(a), np.nan, dtype=a.dtype)
+    elif _SMA_COMPILED:
+        out = _sma_core(a, int(window))
+    else:
+        out = _sma_cumsum(a, int(window))
+    # wrap the kernel buffer as-is and share the input index, no copies
+    return pd.Series(out, index=series.index, name=f"SMA_{window}", copy=False)
 
 # --- Relative Strength Index (Wilder) ---
-def rsi(series: pd.Series, window: int | None = None, period: int = 14) -> pd.Series:
+def rsi(
+    series: pd.Series | pd.DataFrame,
+    window: int | None = None,
+    period: int = 14,
+    dtype: np.dtype = np.float64,
+    out: np.ndarray | None = None,
+) -> pd.Series | pd.DataFrame:
     win = window if window is not None else period
-    delta = series.diff()
-    up = delta.clip(lower=0)
-    down = -delta.clip(upper=0)
-    roll_up = up.ewm(alpha=1 / win, adjust=False).mean()
-    roll_down = down.ewm(alpha=1 / win, adjust=False).mean()
-    rs = roll_up / roll_down
-    out = 100 - 100 / (1 + rs)
-    return out.rename(f"RSI_{win}")
+    if isinstance(series, pd.DataFrame):
+        # one column per ticker: all columns in a single parallel pass
+        if out is not None:
+            raise ValueError("out is only supported for a Series")
+        vals = rsi_matrix(series.to_numpy(dtype=dtype), win)
+        return pd.DataFrame(vals, index=series.index, columns=series.columns)
+    a = np.ascontiguousarray(series.to_numpy(dtype=dtype))
+    # ``out`` lets period sweeps reuse one buffer; the returned Series is a view of it
+    if out is None:
+        out = np.empty_like(a)
+    elif out.shape != a.shape or out.dtype != a.dtype:
+        raise ValueError("out must have the series' length and dtype")
+    _rsi_core(a, int(win), out)
+    return pd.Series(out, index=series.index, name=f"RSI_{win}", copy=False)
+
+# the column kernel calls it from nopython code, so it needs the JIT build (not the AOT one)
+_rsi_jit = njit(cache=True, fastmath=_FASTMATH)(_kernels.rsi_wilder)
+
+@njit(parallel=True, cache=True)
+def _rsi_matrix_core(prices: np.ndarray, period: int) -> np.ndarray:
+    out = np.empty_like(prices)
+    for j in prange(prices.shape[1]):
+        _rsi_jit(prices[:, j], period, out[:, j])
+    return out
+
+def rsi_matrix(prices: np.ndarray, period: int = 14) -> np.ndarray:
+    """Wilder RSI of every column of a 2-D price array, one thread per column."""
+    # column-major so each column the kernel walks is contiguous; ints and other
+    # dtypes are coerced so integer deltas are not truncated in the output
+    prices = np.asarray(prices)
+    dtype = np.float32 if prices.dtype == np.float32 else np.float64
+    return _rsi_matrix_core(np.asfortranarray(prices, dtype=dtype), int(period))
 
 # --- Exponential Moving Average ---
 def ema(series: pd.Series, window: int = 20) -> pd.Series:
@@ -38,4 +152,4 @@ def bollinger(series: pd.Series, window: int = 20, n_std: float = 2.0) -> pd.Dat
     lower = mid - n_std * std
     return pd.DataFrame({"BB_mid": mid, "BB_upper": upper, "BB_lower": lower})
 
-__all__ = ["sma", "rsi", "ema", "macd", "bollinger"]
+__all__ = ["sma", "rsi", "rsi_matrix", "ema", "macd", "bollinger"]
@@ -1,7 +1,30 @@
 ﻿import numpy as np
 import pandas as pd
-from .strategies import signals_sma_crossover
-from .backtest import run_backtest
+from . import _kernels
+from ._jit import njit, prange
+from .indicators import sma
+from .utils import Interval, _stats, parse_interval
+
+# the grid kernel calls it from nopython code, so it needs the JIT build (not the AOT one)
+_backtest_jit = njit(cache=True)(_kernels.backtest_core)
+
+_METRIC_ROW = {"CAGR": 0, "Sharpe": 1, "MaxDD": 2}
+
+
+@njit(parallel=True, cache=True)
+def _grid(close, sma_mat, fast_idx, slow_idx, cost_rate, ppy):
+    # one independent long-only crossover backtest per (fast, slow) pair
+    m = fast_idx.shape[0]
+    out = np.empty((3, m))
+    for k in prange(m):
+        sig = (sma_mat[fast_idx[k]] > sma_mat[slow_idx[k]]).astype(np.float64)
+        res = _backtest_jit(close, sig, cost_rate)
+        cagr, sharpe, mdd = _stats(res[1], res[0], ppy, 0.0)
+        out[0, k] = cagr
+        out[1, k] = sharpe
+        out[2, k] = mdd
+    return out
+
 
 def grid_search_sma(
     close: pd.Series,
@@ -9,26 +32,38 @@ def grid_search_sma(
     slow_range: range,
     fee_bps: int = 0,
     slippage_bps: int = 0,
-    interval: str = "1d",
+    interval: str | Interval = "1d",
     metric: str = "Sharpe",
 ) -> pd.DataFrame:
-    rows = []
-    for f in fast_range:
-        row = {}
-        for s in slow_range:
-            if f >= s:
-                row[s] = np.nan
-                continue
-            sig, _ = signals_sma_crossover(close, fast=f, slow=s)
-            bt, m = run_backtest(
-                close.to_frame(name="close"),
-                sig,
-                fee_bps=fee_bps,
-                slippage_bps=slippage_bps,
-                interval=interval,
-            )
-            row[s] = float(m.get(metric, float("nan")))
-        rows.append(pd.Series(row, name=f))
-    return pd.DataFrame(rows)
-
-__all__ = ["grid_search_sma"]
+    ppy = float(parse_interval(interval))
+    fast = list(fast_range)
+    slow = list(slow_range)
+    close = pd.to_numeric(close, errors="coerce")
+    z = np.full((len(fast), len(slow)), np.nan)
+
+    pairs = [(i, j) for i, f in enumerate(fast) for j, s in enumerate(slow) if f < s]
+    row = _METRIC_ROW.get(metric)
+    if pairs and row is not None:
+        # each window's SMA is computed once and shared by every pair that uses it
+        windows = sorted(set(fast) | set(slow))
+        pos = {w: k for k, w in enumerate(windows)}
+        sma_mat = np.vstack([sma(close, w).to_numpy(dtype=np.float64) for w in windows])
+        fi = np.array([pos[fast[i]] for i, _ in pairs], dtype=np.int64)
+        si = np.array([pos[slow[j]] for _, j in pairs], dtype=np.int64)
+        if len(close):
+            vals = _grid(
+                close.to_numpy(dtype=np.float64),
+                sma_mat,
+                fi,
+                si,
+                (fee_bps + slippage_bps) / 10000.0,
+                ppy,
+            )[row]
+        else:
+            vals = np.zeros(len(pairs))
+        ii, jj = zip(*pairs)
+        z[list(ii), list(jj)] = vals
+
+    return pd.DataFrame(z, index=fast, columns=slow)
+
+__all__ = ["grid_search_sma"]
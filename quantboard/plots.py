@@ -3,6 +3,8 @@ from __future__ import annotations
 
 from plotly.subplots import make_subplots
 import plotly.graph_objects as go
+import plotly.io as pio
+import numpy as np
 import pandas as pd
 
 
@@ -16,21 +18,66 @@ THEME_COLORWAY = [
 ]
 
 
+_THEME_LAYOUT = dict(
+    paper_bgcolor="rgba(0,0,0,0)",
+    plot_bgcolor="#0F1115",
+    font=dict(color="#E5E7EB"),
+    colorway=THEME_COLORWAY,
+)
+_THEME_AXES = dict(gridcolor="#2A2F37", zeroline=False)
+
+
+def _build_template() -> go.layout.Template:
+    template = go.layout.Template(pio.templates["plotly_dark"])
+    template.layout.update(_THEME_LAYOUT, xaxis=_THEME_AXES, yaxis=_THEME_AXES)
+    return template
+
+
+# Registered once per process for figures built outside apply_plotly_theme
+pio.templates["quantboard"] = _build_template()
+pio.templates.default = "quantboard"
+
+
 def apply_plotly_theme(fig: go.Figure) -> go.Figure:
     """Apply the QuantBoard Plotly styling to a figure."""
 
-    fig.update_layout(
-        template="plotly_dark",
-        paper_bgcolor="rgba(0,0,0,0)",
-        plot_bgcolor="#0F1115",
-        font=dict(color="#E5E7EB"),
-        colorway=THEME_COLORWAY,
-    )
-    fig.update_xaxes(gridcolor="#2A2F37", zeroline=False)
-    fig.update_yaxes(gridcolor="#2A2F37", zeroline=False)
+    # set on fig.layout, not only the template: st.plotly_chart's streamlit
+    # theme overwrites template values but leaves explicit layout keys alone
+    fig.update_layout(template="quantboard", **_THEME_LAYOUT)
+    fig.update_xaxes(**_THEME_AXES)
+    fig.update_yaxes(**_THEME_AXES)
     return fig
 
 
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Positions kept by Largest-Triangle-Three-Buckets downsampling of ``(x, y)``.
+
+    Always keeps the first and last point. Returns every position when the
+    series already has ``n_out`` points or fewer, so several aligned series can
+    be sliced with the same indices.
+    """
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    idx = np.empty(n_out, dtype=np.int64)
+    idx[0], idx[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        nxt = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[hi:nxt].mean()
+        avg_y = y[hi:nxt].mean()
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a = lo + int(np.argmax(area))
+        idx[i + 1] = a
+    return idx
+
+
 def price_chart(df: pd.DataFrame, overlays: dict | None = None) -> go.Figure:
     overlays = overlays or {}
     fig = make_subplots(rows=2, cols=1, shared_xaxes=True, row_heights=[0.7, 0.3])
@@ -175,4 +222,4 @@ def heatmap_metric(z_df: pd.DataFrame, title: str = "SMA grid (metric)") -> go.F
     return apply_plotly_theme(fig)
 
 
-__all__ = ["price_chart", "heatmap_metric", "fig_price", "apply_plotly_theme"]
+__all__ = ["price_chart", "heatmap_metric", "fig_price", "apply_plotly_theme", "lttb_indices"]
@@ -1,31 +1,34 @@
-﻿import pandas as pd
+﻿import numpy as np
+import pandas as pd
+from . import _kernels
+from ._jit import njit
 from .indicators import sma, rsi, bollinger
 
+try:
+    from .qb_kernels import rsi_signal as _rsi_signal
+except ImportError:
+    _rsi_signal = njit(cache=True)(_kernels.rsi_signal)
+
 def signals_sma_crossover(close: pd.Series, fast: int = 20, slow: int = 50, allow_short: bool = False):
     f = sma(close, fast)
     s = sma(close, slow)
-    sig = pd.Series(0.0, index=close.index)
+    sig = pd.Series(np.zeros(len(close), dtype=np.int8), index=close.index)
     if allow_short:
         cross_up = (f > s) & (f.shift(1) <= s.shift(1))
         cross_dn = (f < s) & (f.shift(1) >= s.shift(1))
         sig[cross_up] = 1
         sig[cross_dn] = -1
-        sig = sig.replace(0, None).ffill().fillna(0.0)
+        sig = sig.where(sig != 0).ffill().fillna(0).astype(np.int8)
     else:
-        sig = (f > s).astype(float)
+        sig = (f > s).astype(np.int8)
     sig.name = "signal"
     overlays = {"SMA_fast": f, "SMA_slow": s}
     return sig, overlays
 
 def signals_rsi(close: pd.Series, period: int = 14, lower: int = 30, upper: int = 70):
     r = rsi(close, window=period)
-    buy = (r.shift(1) < lower) & (r >= lower)
-    sell = (r.shift(1) > upper) & (r <= upper)
-    sig = pd.Series(0.0, index=close.index)
-    sig[buy] = 1
-    sig[sell] = 0
-    sig = sig.replace(0, None).ffill().fillna(0.0)
-    sig.name = "signal"
+    pos = _rsi_signal(r.to_numpy(dtype=np.float64), float(lower), float(upper))
+    sig = pd.Series(pos, index=close.index, name="signal")
     return sig, {"RSI": r}
 
 def signals_bollinger_mean_reversion(close: pd.Series, window: int = 20, n_std: float = 2.0):
@@ -54,4 +57,4 @@ __all__ = [
     "signals_rsi",
     "signals_bollinger_mean_reversion",
     "signals_donchian_breakout",
-]
+]
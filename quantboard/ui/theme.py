@@ -1,6 +1,8 @@
 """Utilities for applying the QuantBoard global UI theme."""
 from __future__ import annotations
 
+import re
+
 import streamlit as st
 
 
@@ -61,6 +63,17 @@ button[data-baseweb="tab"][aria-selected="true"] {
 """
 
 
+def _minify_css(css: str) -> str:
+    """Drop comments and collapse whitespace so less markup is sent per rerun."""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    return re.sub(r"\s*([{};,>])\s*|\s+", lambda m: m.group(1) or " ", css).strip()
+
+
+# Minified once at import; the markup itself must be re-emitted on every run
+# because Streamlit drops elements that a rerun does not write again.
+_CSS_MIN = _minify_css(CSS)
+
+
 def apply_global_theme() -> None:
     """Inject base CSS tweaks for the QuantBoard theme."""
-    st.markdown(CSS, unsafe_allow_html=True)
+    st.markdown(_CSS_MIN, unsafe_allow_html=True)
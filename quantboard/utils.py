@@ -1,31 +1,129 @@
-﻿import numpy as np
+﻿from dataclasses import dataclass
+from enum import IntEnum
+from functools import lru_cache
+from typing import Final
+
+import numpy as np
 import pandas as pd
 
-_PERIODS_PER_YEAR = {"1d": 252, "1wk": 52, "1mo": 12}
+from ._jit import njit
 
-def periods_per_year(interval: str) -> int:
-    return _PERIODS_PER_YEAR.get(interval, 252)
+# folded once at import
+_TRADING_DAYS: Final[int] = 252
+_HOURS_PER_YEAR: Final[int] = int(_TRADING_DAYS * 6.5)
+_MINUTES_PER_YEAR: Final[int] = _TRADING_DAYS * 390
 
-def compute_cagr(equity: pd.Series, ppy: int = 252) -> float:
-    n = len(equity)
-    if n <= 1:
+class Interval(IntEnum):
+    """Bar interval valued as its periods per year, so it passes straight into kernels."""
+    D1 = _TRADING_DAYS
+    H1 = _HOURS_PER_YEAR
+    WK1 = 52
+    MO1 = 12
+    M1 = _MINUTES_PER_YEAR
+
+_INTERVALS = {
+    "1d": Interval.D1,
+    "1h": Interval.H1,
+    "1wk": Interval.WK1,
+    "1mo": Interval.MO1,
+    "1m": Interval.M1,
+}
+
+def parse_interval(interval: str | Interval | None) -> Interval:
+    """Map a yfinance interval string to an ``Interval`` once, at the backtest/optimize entry points."""
+    if isinstance(interval, Interval):
+        return interval
+    return _INTERVALS.get((interval or "").lower(), Interval.D1)
+
+@lru_cache(maxsize=16)
+def periods_per_year(interval: str | int) -> int:
+    if isinstance(interval, int):
+        return int(interval)
+    return int(parse_interval(interval))
+
+# code -1 (interval not in _INTERVALS) indexes the trailing D1 default
+_PPY_TABLE = np.array([*_INTERVALS.values(), Interval.D1], dtype=np.int32)
+
+def periods_per_year_array(intervals: pd.Series | np.ndarray | list[str]) -> np.ndarray:
+    """Vectorised ``periods_per_year`` for a column of interval strings: one gather over a lookup table."""
+    codes = pd.Categorical(intervals, categories=list(_INTERVALS)).codes
+    return _PPY_TABLE[codes]
+
+def _cagr_np(arr: np.ndarray, ppy: int = 252) -> float:
+    if arr.size <= 1:
         return 0.0
-    total = float(equity.iloc[-1]) / float(equity.iloc[0])
-    years = n / ppy
+    total = float(arr[-1]) / float(arr[0])
+    years = arr.size / ppy
     if years <= 0:
         return 0.0
     return total ** (1 / years) - 1
 
-def compute_sharpe(returns: pd.Series, ppy: int = 252, rf: float = 0.0) -> float:
-    if len(returns) < 2:
+def compute_cagr(equity: pd.Series, ppy: int = 252) -> float:
+    return _cagr_np(equity.to_numpy(), ppy)
+
+@njit(cache=True)
+def _sharpe(r: np.ndarray, ppy: float, rf: float) -> float:
+    # Welford: mean and variance in a single pass
+    n = r.shape[0]
+    if n < 2:
         return 0.0
-    mu = float(returns.mean())
-    sigma = float(returns.std(ddof=0))
+    mu = 0.0
+    m2 = 0.0
+    for i in range(n):
+        d = r[i] - mu
+        mu += d / (i + 1)
+        m2 += d * (r[i] - mu)
+    sigma = np.sqrt(m2 / n)
     if sigma == 0:
         return 0.0
     return (mu - rf / ppy) / sigma * np.sqrt(ppy)
 
+def compute_sharpe(returns: pd.Series, ppy: int = 252, rf: float = 0.0) -> float:
+    if len(returns) < 2:
+        return 0.0
+    r = returns.to_numpy(dtype=np.float64)
+    r = r[~np.isnan(r)]
+    return float(_sharpe(r, float(ppy), float(rf)))
+
 def max_drawdown(equity: pd.Series) -> float:
     roll_max = equity.cummax()
     dd = equity / roll_max - 1.0
-    return float(dd.min())
+    return float(dd.min())
+
+@njit(cache=True)
+def _stats(eq: np.ndarray, ret: np.ndarray, ppy: float, rf: float):
+    # one streaming pass: running max/drawdown on equity, Welford mean/var on returns
+    n = eq.shape[0]
+    rmax = eq[0]
+    mdd = 0.0
+    mu = 0.0
+    m2 = 0.0
+    for i in range(n):
+        if eq[i] > rmax:
+            rmax = eq[i]
+        dd = eq[i] / rmax - 1.0
+        if dd < mdd:
+            mdd = dd
+        d = ret[i] - mu
+        mu += d / (i + 1)
+        m2 += d * (ret[i] - mu)
+    sigma = np.sqrt(m2 / n)
+    sharpe = (mu - rf / ppy) / sigma * np.sqrt(ppy) if n > 1 and sigma > 0 else 0.0
+    cagr = (eq[-1] / eq[0]) ** (ppy / n) - 1.0 if n > 1 and eq[0] > 0 and eq[-1] > 0 else 0.0
+    return cagr, sharpe, mdd
+
+@dataclass
+class PerfStats:
+    cagr: float
+    sharpe: float
+    max_drawdown: float
+
+    @classmethod
+    def compute(cls, equity: pd.Series, returns: pd.Series, ppy: int = 252, rf: float = 0.0) -> "PerfStats":
+        """CAGR, Sharpe and max drawdown of an equity curve in a single pass."""
+        eq = equity.to_numpy(dtype=np.float64)
+        ret = returns.to_numpy(dtype=np.float64)
+        if eq.size == 0:
+            return cls(0.0, 0.0, 0.0)
+        cagr, sharpe, mdd = _stats(eq, ret, float(ppy), float(rf))
+        return cls(float(cagr), float(sharpe), float(mdd))
@@ -1,40 +1,135 @@
 from __future__ import annotations
 
 from datetime import date, datetime, timedelta
-import time
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import streamlit as st
 
-from quantboard.data import get_prices
-from quantboard.indicators import sma, rsi
-from quantboard.plots import apply_plotly_theme
+from quantboard.app_utils import autorefresh_if_needed, fetch_prices_cached, format_ts
+from quantboard.indicators import rsi
+from quantboard.plots import apply_plotly_theme, lttb_indices
 from quantboard.ui.theme import apply_global_theme
 
 st.set_page_config(page_title="QuantBoard", page_icon="📈", layout="wide")
 apply_global_theme()
 
-# --- Auto-refresh (every 60s) for 1m interval ---
-def _autorefresh_if_needed(enabled: bool, interval: str) -> None:
-    if not enabled or interval != "1m":
-        return
-    key = "_qb_autorefresh_last"
-    now = time.time()
-    last = st.session_state.get(key, 0.0)
-    if now - last >= 60.0:
-        st.session_state[key] = now
-        st.rerun()
-
-@st.cache_data(ttl=60, show_spinner=False)
-def fetch_prices_cached(ticker: str, start: date | datetime, end: date | datetime, interval: str) -> pd.DataFrame:
-    df = get_prices((ticker or "").strip().upper(), start=start, end=end, interval=interval)
-    if df is None or df.empty:
-        return pd.DataFrame()
-    # normaliza a minúscula
-    df = df.rename(columns=str.lower)
-    df.index = pd.to_datetime(df.index)
-    return df.dropna()
+TAIL_ROWS = 50
+
+def _bars_key(prices: pd.DataFrame) -> tuple[int, int]:
+    # O(1) fingerprint (length, last bar in ns): changes whenever new bars arrive
+    return len(prices), int(prices.index[-1].value)
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _close_cumsum(
+    ticker: str, start: date | datetime, end: date | datetime, interval: str, bars: tuple[int, int]
+) -> tuple[pd.DatetimeIndex, np.ndarray]:
+    # shared by every SMA window: any window is then an O(n) difference
+    prices = fetch_prices_cached(ticker, start=start, end=end, interval=interval)
+    close = prices["close"].to_numpy(dtype=np.float64)
+    return prices.index, np.concatenate(([0.0], np.cumsum(close)))
+
+@st.cache_data(ttl=300, show_spinner=False)
+def cached_sma(
+    ticker: str, start: date | datetime, end: date | datetime, interval: str, window: int, bars: tuple[int, int]
+) -> pd.Series:
+    # keyed on scalars plus the bars fingerprint, never on the price series itself;
+    # length and index come from the same frame as the cumsum
+    index, cs = _close_cumsum(ticker, start, end, interval, bars)
+    out = np.full(len(index), np.nan)
+    if window <= len(index):
+        out[window - 1:] = (cs[window:] - cs[:-window]) / window
+    return pd.Series(out, index=index, name=f"SMA_{window}")
+
+@st.cache_data(ttl=300, show_spinner=False)
+def cached_rsi(
+    ticker: str, start: date | datetime, end: date | datetime, interval: str, window: int, bars: tuple[int, int]
+) -> pd.Series:
+    prices = fetch_prices_cached(ticker, start=start, end=end, interval=interval)
+    return rsi(prices["close"], window=window)
+
+@st.cache_data(ttl=300, max_entries=32, show_spinner=False)
+def _price_tail(
+    ticker: str, start: date | datetime, end: date | datetime, interval: str, bars: tuple[int, int]
+) -> pd.DataFrame:
+    prices = fetch_prices_cached(ticker, start=start, end=end, interval=interval)
+    return prices.tail(TAIL_ROWS).round(4)
+
+# --- Plot decimation: cap the points sent to the browser ---
+MAX_PLOT_POINTS = 5000
+SCATTERGL_MIN_POINTS = 1000
+LTTB_POINTS = 4000
+
+def _plot_slice(n: int) -> slice:
+    # stride anchored on the last bar so the latest candle is always drawn
+    step = max(1, n // MAX_PLOT_POINTS)
+    return slice((n - 1) % step, None, step)
+
+# figures are keyed on the bars fingerprint too, so new bars rebuild them and nothing else does
+@st.cache_resource(ttl=300, max_entries=32, show_spinner=False)
+def _build_price_fig(
+    ticker: str, start: date | datetime, end: date | datetime, interval: str, bars: tuple[int, int]
+) -> go.Figure:
+    prices = fetch_prices_cached(ticker, start=start, end=end, interval=interval)
+    p = prices.iloc[_plot_slice(len(prices))]
+    fig = go.Figure()
+    fig.add_candlestick(
+        x=p.index,
+        open=p.get("open", p["close"]),
+        high=p.get("high", p["close"]),
+        low=p.get("low", p["close"]),
+        close=p["close"],
+        name="OHLC",
+    )
+    return apply_plotly_theme(fig)
+
+@st.cache_resource(ttl=300, max_entries=32, show_spinner=False)
+def _build_indicator_fig(
+    ticker: str,
+    start: date | datetime,
+    end: date | datetime,
+    interval: str,
+    sma_win: int,
+    rsi_win: int,
+    bars: tuple[int, int],
+) -> go.Figure:
+    prices = fetch_prices_cached(ticker, start=start, end=end, interval=interval)
+    close = prices["close"]
+    sma_ser = cached_sma(ticker, start, end, interval, sma_win, bars)
+    rsi_ser = cached_rsi(ticker, start, end, interval, rsi_win, bars)
+    # the cached series may trail a fresh 1m frame by a bar: align them on the
+    # close's timestamps, then keep the LTTB picks by label so the panels match
+    keep = close.index[lttb_indices(np.arange(len(close)), close.to_numpy(), LTTB_POINTS)]
+    close = close.loc[keep]
+    sma_ser = sma_ser.reindex(keep)
+    rsi_ser = rsi_ser.reindex(keep)
+
+    g = make_subplots(rows=2, cols=1, shared_xaxes=True, vertical_spacing=0.07, row_heights=[0.65, 0.35])
+    # WebGL only pays off past ~1k points; SVG is faster below that
+    line = go.Scattergl if len(close) >= SCATTERGL_MIN_POINTS else go.Scatter
+    # plain lists, built once per figure: plotly.js skips its typed-array clean-up on relayout
+    x = close.index.strftime("%Y-%m-%dT%H:%M:%S").tolist()
+    g.add_trace(line(x=x, y=close.to_numpy().tolist(), mode="lines", name="Close"), row=1, col=1)
+    g.add_trace(line(x=x, y=sma_ser.to_numpy().tolist(), mode="lines", name=f"SMA {sma_win}"), row=1, col=1)
+    g.add_trace(line(x=x, y=rsi_ser.to_numpy().tolist(), mode="lines", name=f"RSI {rsi_win}"), row=2, col=1)
+    g.add_hline(y=70, line_dash="dot", row=2, col=1)
+    g.add_hline(y=30, line_dash="dot", row=2, col=1)
+    g.update_layout(margin=dict(l=30, r=20, t=30, b=30), height=600)
+    return apply_plotly_theme(g)
+
+@st.fragment
+def _indicator_tab(ticker: str, start: date | datetime, end: date | datetime, interval: str) -> None:
+    # slider drags rerun only this block, not the metrics and price tab; the
+    # fingerprint is taken here so it matches the frame this run sees
+    bars = _bars_key(fetch_prices_cached(ticker, start=start, end=end, interval=interval))
+    st.subheader("SMA/RSI indicators")
+    col_sma, col_rsi = st.columns(2)
+    sma_win = col_sma.slider("SMA window", 5, 200, 20, 1)
+    rsi_win = col_rsi.slider("RSI window", 2, 50, 14, 1)
+
+    g = _build_indicator_fig(ticker, start, end, interval, int(sma_win), int(rsi_win), bars)
+    st.plotly_chart(g, use_container_width=True)
 
 def main() -> None:
     st.title("QuantBoard — Real-time Technical Analysis")
@@ -45,7 +140,9 @@ def main() -> None:
 
     with st.sidebar:
         st.header("Parameters")
-        ticker = st.text_input("Ticker", value="AAPL").strip().upper()
+        # the Watchlist "Open in Home" button hands over qb_ticker; ?ticker=... serves deep links
+        default_ticker = st.session_state.get("qb_ticker") or st.query_params.get("ticker", "AAPL")
+        ticker = st.text_input("Ticker", value=default_ticker).strip().upper()
         start_date = st.date_input("From", value=default_start, max_value=today)
         end_date = st.date_input("To", value=today, min_value=default_start, max_value=today)
         interval = st.selectbox("Interval", ["1d", "1h", "1wk", "1m"], index=0)
@@ -55,7 +152,7 @@ def main() -> None:
         st.error("The 'From' date must be earlier than 'To'.")
         return
 
-    _autorefresh_if_needed(auto_refresh, interval)
+    autorefresh_if_needed(auto_refresh, interval)
 
     if not ticker:
         st.info("Enter a ticker to begin.")
@@ -68,7 +165,7 @@ def main() -> None:
         st.error("No data for the selected range/interval.")
         return
 
-    close = pd.to_numeric(prices["close"], errors="coerce")
+    close = prices["close"]
     latest_ts = prices.index[-1]
     latest_price = float(close.iloc[-1])
     prev_price = float(close.iloc[-2]) if len(close) > 1 else float("nan")
@@ -78,44 +175,23 @@ def main() -> None:
     c1, c2, c3 = st.columns(3)
     c1.metric("Last Price", f"{latest_price:,.2f}", f"{delta:+,.2f}" if pd.notna(prev_price) else None)
     c2.metric("Change %", f"{pct:+.2f}%" if pd.notna(prev_price) else "N/A")
-    c3.metric("Last Bar", latest_ts.strftime("%Y-%m-%d %H:%M:%S"))
+    c3.metric("Last Bar", format_ts(latest_ts))
 
     st.caption(f"Loaded candles: {len(prices):,}")
+    bars = _bars_key(prices)
 
     tab_price, tab_ind = st.tabs(["Price", "Indicators"])
     with tab_price:
         st.subheader("Price chart")
-        fig = go.Figure()
-        fig.add_candlestick(
-            x=prices.index,
-            open=prices.get("open", prices["close"]),
-            high=prices.get("high", prices["close"]),
-            low=prices.get("low", prices["close"]),
-            close=prices["close"],
-            name="OHLC",
-        )
-        apply_plotly_theme(fig)
+        fig = _build_price_fig(ticker, start_date, end_date, interval, bars)
         st.plotly_chart(fig, use_container_width=True)
-        st.dataframe(prices.tail(50), use_container_width=True)
+        if len(prices) > TAIL_ROWS:
+            st.table(_price_tail(ticker, start_date, end_date, interval, bars))
+        else:
+            st.table(prices.round(4))
 
     with tab_ind:
-        st.subheader("SMA/RSI indicators")
-        col_sma, col_rsi = st.columns(2)
-        sma_win = col_sma.slider("SMA window", 5, 200, 20, 1)
-        rsi_win = col_rsi.slider("RSI window", 2, 50, 14, 1)
-
-        sma_ser = sma(close, int(sma_win))
-        rsi_ser = rsi(close, window=int(rsi_win))
-
-        g = make_subplots(rows=2, cols=1, shared_xaxes=True, vertical_spacing=0.07, row_heights=[0.65, 0.35])
-        g.add_trace(go.Scatter(x=prices.index, y=close, mode="lines", name="Close"), row=1, col=1)
-        g.add_trace(go.Scatter(x=sma_ser.index, y=sma_ser, mode="lines", name=f"SMA {sma_win}"), row=1, col=1)
-        g.add_trace(go.Scatter(x=rsi_ser.index, y=rsi_ser, mode="lines", name=f"RSI {rsi_win}"), row=2, col=1)
-        g.add_hline(y=70, line_dash="dot", row=2, col=1)
-        g.add_hline(y=30, line_dash="dot", row=2, col=1)
-        g.update_layout(margin=dict(l=30, r=20, t=30, b=30), height=600)
-        apply_plotly_theme(g)
-        st.plotly_chart(g, use_container_width=True)
+        _indicator_tab(ticker, start_date, end_date, interval)
 
 
 if __name__ == "__main__":